@@ -1,5 +1,6 @@
 from typing import List
 
+import numpy as np
 import pandas_ta as ta  # noqa: F401
 from hummingbot.client.config.config_data_types import ClientFieldData
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
@@ -81,6 +82,9 @@ class MACDBBV1Controller(DirectionalTradingControllerBase):
                 interval=config.interval,
                 max_records=self.max_records
             )]
+        self._bbp_col = f"BBP_{config.bb_length}_{config.bb_std}"
+        self._macd_col = f"MACD_{config.macd_fast}_{config.macd_slow}_{config.macd_signal}"
+        self._macdh_col = f"MACDh_{config.macd_fast}_{config.macd_slow}_{config.macd_signal}"
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
@@ -92,18 +96,16 @@ class MACDBBV1Controller(DirectionalTradingControllerBase):
         df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
         df.ta.macd(fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal, append=True)
 
-        bbp = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
-        macdh = df[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
-        macd = df[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+        bbp = df[self._bbp_col].to_numpy()
+        macdh = df[self._macdh_col].to_numpy()
+        macd = df[self._macd_col].to_numpy()
 
-        # Generate signal
+        # Generate signal on raw ndarrays to skip pandas index alignment
         long_condition = (bbp < self.config.bb_long_threshold) & (macdh > 0) & (macd < 0)
         short_condition = (bbp > self.config.bb_short_threshold) & (macdh < 0) & (macd > 0)
-
-        df["signal"] = 0
-        df.loc[long_condition, "signal"] = 1
-        df.loc[short_condition, "signal"] = -1
+        signal = np.where(long_condition, 1, np.where(short_condition, -1, 0))
+        df["signal"] = signal
 
         # Update processed data
-        self.processed_data["signal"] = df["signal"].iloc[-1]
+        self.processed_data["signal"] = signal[-1]
         self.processed_data["features"] = df
@@ -1,6 +1,7 @@
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas_ta as ta  # noqa: F401
 from hummingbot.client.config.config_data_types import ClientFieldData
 from hummingbot.core.data_type.common import TradeType
@@ -47,7 +48,7 @@ class DManMakerV2Config(MarketMakingControllerConfigBase):
         client_data=ClientFieldData(
             is_updatable=True,
             prompt_on_new=False))
-    executor_activation_bounds: Optional[List[Decimal]] = Field(
+    executor_activation_bounds: Optional[Tuple[Decimal, ...]] = Field(
         default=None,
         client_data=ClientFieldData(
             is_updatable=True,
@@ -58,11 +59,11 @@ class DManMakerV2Config(MarketMakingControllerConfigBase):
     @validator("executor_activation_bounds", pre=True, always=True)
     def parse_activation_bounds(cls, v):
         if isinstance(v, list):
-            return [Decimal(val) for val in v]
+            return tuple(map(Decimal, v))
         elif isinstance(v, str):
             if v == "":
                 return None
-            return [Decimal(val) for val in v.split(",")]
+            return tuple(map(Decimal, v.split(",")))
         return v
 
     @validator('dca_spreads', pre=True, always=True)
@@ -91,43 +92,58 @@ class DManMakerV2(MarketMakingControllerBase):
     def __init__(self, config: DManMakerV2Config, *args, **kwargs):
         super().__init__(config, *args, **kwargs)
         self.config = config
-        self.dca_amounts_pct = [Decimal(amount) / sum(self.config.dca_amounts) for amount in self.config.dca_amounts]
+        amounts = np.asarray(self.config.dca_amounts, dtype=np.float64)
+        amounts /= amounts.sum()
+        self.dca_amounts_pct = tuple(Decimal(str(pct)) for pct in amounts)
+        self._pct_arr = amounts
         self.spreads = self.config.dca_spreads
+        self._spreads_f = np.asarray(self.spreads, dtype=np.float64)
+        self._buy_factors = 1.0 - self._spreads_f
+        self._sell_factors = 1.0 + self._spreads_f
 
-    def first_level_refresh_condition(self, executor):
+    def first_level_refresh_condition(self, executor, now):
         if self.config.top_executor_refresh_time is not None:
             if self.get_level_from_level_id(executor.custom_info["level_id"]) == 0:
-                return self.market_data_provider.time() - executor.timestamp > self.config.top_executor_refresh_time * 1000
+                return now - executor.timestamp > self.config.top_executor_refresh_time * 1000
         return False
 
-    def order_level_refresh_condition(self, executor):
-        return self.market_data_provider.time() - executor.timestamp > self.config.executor_refresh_time * 1000
+    def order_level_refresh_condition(self, executor, now):
+        return now - executor.timestamp > self.config.executor_refresh_time * 1000
 
     def executors_to_refresh(self) -> List[ExecutorAction]:
+        now = self.market_data_provider.time()
         executors_to_refresh = self.filter_executors(
             executors=self.executors_info,
             filter_func=lambda x: not x.is_trading and x.is_active and (
-                        self.order_level_refresh_condition(x) or self.first_level_refresh_condition(x)))
+                        self.order_level_refresh_condition(x, now) or self.first_level_refresh_condition(x, now)))
         return [StopExecutorAction(
             controller_id=self.config.id,
             executor_id=executor.id) for executor in executors_to_refresh]
 
     def get_executor_config(self, level_id: str, price: Decimal, amount: Decimal):
-        trade_type = self.get_trade_type_from_level_id(level_id)
-        if trade_type == TradeType.BUY:
-            prices = [price * (1 - spread) for spread in self.spreads]
-        else:
-            prices = [price * (1 + spread) for spread in self.spreads]
-        amounts = [amount * pct for pct in self.dca_amounts_pct]
-        amounts_quote = [amount * price for amount, price in zip(amounts, prices)]
-        return DCAExecutorConfig(
-            timestamp=self.market_data_provider.time(),
+        return self.get_executor_configs_bulk([level_id], [price], [amount])[0]
+
+    def get_executor_configs_bulk(self, level_ids: List[str], prices: List[Decimal],
+                                  amounts: List[Decimal]) -> List[DCAExecutorConfig]:
+        """
+        Build DCA executor configs for many levels at once, sharing one timestamp
+        snapshot and computing all ladders as a single (levels x dca_levels)
+        broadcast instead of re-entering get_executor_config per level.
+        """
+        timestamp = self.market_data_provider.time()
+        trade_types = [self.get_trade_type_from_level_id(level_id) for level_id in level_ids]
+        factors = np.asarray([self._buy_factors if trade_type == TradeType.BUY else self._sell_factors
+                              for trade_type in trade_types])
+        price_matrix = np.asarray(prices, dtype=np.float64)[:, np.newaxis] * factors
+        quote_matrix = np.asarray(amounts, dtype=np.float64)[:, np.newaxis] * self._pct_arr * price_matrix
+        return [DCAExecutorConfig(
+            timestamp=timestamp,
             connector_name=self.config.connector_name,
             trading_pair=self.config.trading_pair,
             mode=DCAMode.MAKER,
             side=trade_type,
-            prices=prices,
-            amounts_quote=amounts_quote,
+            prices=[Decimal(repr(float(level_price))) for level_price in level_prices],
+            amounts_quote=[Decimal(repr(float(quote))) for quote in level_quotes],
             level_id=level_id,
             time_limit=self.config.time_limit,
             stop_loss=self.config.stop_loss,
@@ -135,4 +151,4 @@ class DManMakerV2(MarketMakingControllerBase):
             trailing_stop=self.config.trailing_stop,
             activation_bounds=self.config.executor_activation_bounds,
             leverage=self.config.leverage,
-        )
+        ) for level_id, trade_type, level_prices, level_quotes in zip(level_ids, trade_types, price_matrix, quote_matrix)]
@@ -1,7 +1,10 @@
+import math
+from collections import deque
 from decimal import Decimal
 from typing import List
 
-import pandas_ta as ta  # noqa: F401
+import numpy as np
+import talib
 from hummingbot.client.config.config_data_types import ClientFieldData
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.strategy_v2.controllers.market_making_controller_base import (
@@ -11,6 +14,21 @@ from hummingbot.strategy_v2.controllers.market_making_controller_base import (
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from pydantic import Field, validator
 
+_MULTIPLIER_PRECISION = Decimal("0.00000001")
+
+
+def _macd_and_natr(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   fast: int, slow: int, signal: int, natr_length: int):
+    """
+    Compute the MACD line, MACD histogram and normalized ATR through TA-Lib's C
+    backend, returning plain ndarrays (leading values are NaN during warm-up).
+    Only the tails are consumed live, while the full natr array still backs the
+    features DataFrame.
+    """
+    macd, _, macdh = talib.MACD(close, fastperiod=fast, slowperiod=slow, signalperiod=signal)
+    natr = talib.NATR(high, low, close, timeperiod=natr_length) / 100.0
+    return macd, macdh, natr
+
 
 class PMMDynamicControllerConfig(MarketMakingControllerConfigBase):
     controller_name = "pmm_dynamic"
@@ -97,37 +115,161 @@ class PMMDynamicController(MarketMakingControllerBase):
                 interval=config.interval,
                 max_records=self.max_records
             )]
+        # plain copies of the static config fields read in the hot methods, so
+        # control-loop ticks skip pydantic's attribute machinery
+        self._candles_connector = config.candles_connector
+        self._candles_trading_pair = config.candles_trading_pair
+        self._interval = config.interval
+        self._connector_name = config.connector_name
+        self._trading_pair = config.trading_pair
+        self._macd_fast = config.macd_fast
+        self._macd_slow = config.macd_slow
+        self._macd_signal = config.macd_signal
+        self._natr_length = config.natr_length
+        self._tick_ts = 0.0
+        self._last_candle_ts = None
+        self._price_multiplier = 0.0
+        self._spread_multiplier = Decimal("0")
+        self._features = None
+        # incremental indicator state, committed through the last closed candle
+        self._alpha_fast = 2.0 / (config.macd_fast + 1.0)
+        self._alpha_slow = 2.0 / (config.macd_slow + 1.0)
+        self._alpha_signal = 2.0 / (config.macd_signal + 1.0)
+        self._ema_fast = 0.0
+        self._ema_slow = 0.0
+        self._ema_signal = 0.0
+        self._atr = 0.0
+        self._prev_close = 0.0
+        # sized to match the baseline pandas_ta sample count (valid MACD values in the window)
+        self._macd_window = deque(maxlen=self.max_records - config.macd_slow + 1)
+        self._macd_sum = 0.0
+        self._macd_sumsq = 0.0
         super().__init__(config, *args, **kwargs)
 
+    def _seed_indicator_state(self, high: np.ndarray, low: np.ndarray, close: np.ndarray):
+        """
+        Rebuild the incremental EMA/ATR state from a window of closed candles.
+        O(window); runs on start-up and after a gap in the candle feed.
+        """
+        ema_fast = talib.EMA(close, timeperiod=self._macd_fast)
+        ema_slow = talib.EMA(close, timeperiod=self._macd_slow)
+        macd = ema_fast - ema_slow
+        macd_valid = macd[~np.isnan(macd)]
+        # talib.MACD does not expose its signal-line state, so replay the recursion once
+        ema_signal = macd_valid[0]
+        for value in macd_valid[1:]:
+            ema_signal += self._alpha_signal * (value - ema_signal)
+        self._ema_fast = float(ema_fast[-1])
+        self._ema_slow = float(ema_slow[-1])
+        self._ema_signal = float(ema_signal)
+        self._atr = float(talib.ATR(high, low, close, timeperiod=self._natr_length)[-1])
+        self._prev_close = float(close[-1])
+        window_values = macd_valid[-self._macd_window.maxlen:]
+        self._macd_window.clear()
+        self._macd_window.extend(window_values)
+        self._macd_sum = float(window_values.sum())
+        self._macd_sumsq = float(np.dot(window_values, window_values))
+
+    def _roll_indicator_state(self, high: float, low: float, close: float):
+        """Advance the EMA/ATR state by one newly closed candle; O(1)."""
+        self._ema_fast += self._alpha_fast * (close - self._ema_fast)
+        self._ema_slow += self._alpha_slow * (close - self._ema_slow)
+        macd = self._ema_fast - self._ema_slow
+        self._ema_signal += self._alpha_signal * (macd - self._ema_signal)
+        tr = max(high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+        self._atr += (tr - self._atr) / self._natr_length
+        self._prev_close = close
+        if len(self._macd_window) == self._macd_window.maxlen:
+            evicted = self._macd_window[0]
+            self._macd_sum -= evicted
+            self._macd_sumsq -= evicted * evicted
+        self._macd_window.append(macd)
+        self._macd_sum += macd
+        self._macd_sumsq += macd * macd
+
+    def _provisional_signals(self, high: float, low: float, close: float):
+        """
+        Apply one non-committing step with the still-forming candle and return
+        (macd, macdh, natr, macd_mean, macd_std) as scalars.
+        """
+        ema_fast = self._ema_fast + self._alpha_fast * (close - self._ema_fast)
+        ema_slow = self._ema_slow + self._alpha_slow * (close - self._ema_slow)
+        macd = ema_fast - ema_slow
+        ema_signal = self._ema_signal + self._alpha_signal * (macd - self._ema_signal)
+        macdh = macd - ema_signal
+        tr = max(high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+        atr = self._atr + (tr - self._atr) / self._natr_length
+        mean, std = self._window_stats(macd)
+        return macd, macdh, atr / close, mean, std
+
+    def _window_stats(self, macd: float):
+        """Mean/std of the closed-candle MACD window plus the provisional value."""
+        n = len(self._macd_window) + 1
+        if n < 2:
+            return macd, 0.0
+        total = self._macd_sum + macd
+        total_sq = self._macd_sumsq + macd * macd
+        mean = total / n
+        variance = (total_sq - total * total / n) / (n - 1)
+        std = math.sqrt(variance) if variance > 0.0 else 0.0
+        return mean, std
+
     async def update_processed_data(self):
-        candles = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
-                                                           trading_pair=self.config.candles_trading_pair,
-                                                           interval=self.config.interval,
+        self._tick_ts = self.market_data_provider.time()
+        candles = self.market_data_provider.get_candles_df(connector_name=self._candles_connector,
+                                                           trading_pair=self._candles_trading_pair,
+                                                           interval=self._interval,
                                                            max_records=self.max_records)
-        natr = ta.natr(candles["high"], candles["low"], candles["close"], length=self.config.natr_length) / 100
-        macd_output = ta.macd(candles["close"], fast=self.config.macd_fast,
-                              slow=self.config.macd_slow, signal=self.config.macd_signal)
-        macd = macd_output[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
-        macd_signal = - (macd - macd.mean()) / macd.std()
-        macdh = macd_output[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
-        macdh_signal = macdh.apply(lambda x: 1 if x > 0 else -1)
-        max_price_shift = natr / 2
-        price_multiplier = ((0.5 * macd_signal + 0.5 * macdh_signal) * max_price_shift).iloc[-1]
-        candles["spread_multiplier"] = natr
-        candles["reference_price"] = candles["close"] * (1 + price_multiplier)
+        timestamps = candles["timestamp"].to_numpy(copy=False)
+        close = candles["close"].to_numpy(dtype=np.float64, copy=False)
+        last_candle_ts = int(timestamps[-1])
+        if last_candle_ts != self._last_candle_ts:
+            high = candles["high"].to_numpy(dtype=np.float64, copy=False)
+            low = candles["low"].to_numpy(dtype=np.float64, copy=False)
+            reseed = self._last_candle_ts is None
+            if not reseed:
+                idx = int(np.searchsorted(timestamps, self._last_candle_ts))
+                reseed = idx >= timestamps.shape[0] or int(timestamps[idx]) != self._last_candle_ts
+            if reseed:
+                macd, macdh, natr = _macd_and_natr(high, low, close,
+                                                   fast=self._macd_fast, slow=self._macd_slow,
+                                                   signal=self._macd_signal, natr_length=self._natr_length)
+                self._seed_indicator_state(high[:-1], low[:-1], close[:-1])
+                macd_last = macd[-1]
+                macdh_last = macdh[-1]
+                natr_last = natr[-1]
+                macd_mean, macd_std = self._window_stats(float(macd_last))
+                candles["spread_multiplier"] = natr
+            else:
+                # candles that closed since the last update, excluding the forming one
+                for i in range(idx, timestamps.shape[0] - 1):
+                    self._roll_indicator_state(high[i], low[i], close[i])
+                macd_last, macdh_last, natr_last, macd_mean, macd_std = \
+                    self._provisional_signals(high[-1], low[-1], close[-1])
+                candles["spread_multiplier"] = natr_last
+            # flat MACD windows yield a zero std; keep the signal neutral instead of dividing by it
+            macd_signal = 0.0 if macd_std == 0.0 else - (macd_last - macd_mean) / macd_std
+            macdh_signal = 1.0 if macdh_last > 0 else -1.0
+            # equal-weight blend of both signals scaled by half the NATR (the max price shift)
+            self._price_multiplier = 0.25 * (macd_signal + macdh_signal) * natr_last
+            self._spread_multiplier = Decimal(repr(float(natr_last))).quantize(_MULTIPLIER_PRECISION)
+            candles["reference_price"] = close * (1 + self._price_multiplier)
+            self._features = candles
+            self._last_candle_ts = last_candle_ts
+        reference_price = float(close[-1]) * (1 + self._price_multiplier)
         self.processed_data = {
-            "reference_price": Decimal(candles["reference_price"].iloc[-1]),
-            "spread_multiplier": Decimal(candles["spread_multiplier"].iloc[-1]),
-            "features": candles
+            "reference_price": Decimal(repr(float(reference_price))),
+            "spread_multiplier": self._spread_multiplier,
+            "features": self._features
         }
 
     def get_executor_config(self, level_id: str, price: Decimal, amount: Decimal):
         trade_type = self.get_trade_type_from_level_id(level_id)
         return PositionExecutorConfig(
-            timestamp=self.market_data_provider.time(),
+            timestamp=self._tick_ts,
             level_id=level_id,
-            connector_name=self.config.connector_name,
-            trading_pair=self.config.trading_pair,
+            connector_name=self._connector_name,
+            trading_pair=self._trading_pair,
             entry_price=price,
             amount=amount,
             triple_barrier_config=self.config.triple_barrier_config,